@@ -30,8 +30,15 @@ This file is designed for comprehensive automated testing of xlview.
 """
 
 import io
+import os
+import struct
+import zipfile
+import zlib
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import zip_longest
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.chart import (
     BarChart, LineChart, PieChart, AreaChart, ScatterChart,
     RadarChart, DoughnutChart, Reference, BubbleChart
@@ -47,35 +54,158 @@ from openpyxl.formatting.rule import (
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.comments import Comment
 from openpyxl.drawing.image import Image
-from openpyxl.utils import get_column_letter
+from openpyxl.utils import column_index_from_string
 from openpyxl.worksheet.table import Table, TableStyleInfo
 from openpyxl.workbook.defined_name import DefinedName
 
 
-def create_test_image(color=(255, 0, 0), size=(80, 80)):
-    """Create a simple PNG image in memory."""
-    from PIL import Image as PILImage
-    img = PILImage.new('RGB', size, color)
-    img_bytes = io.BytesIO()
-    img.save(img_bytes, format='PNG')
-    img_bytes.seek(0)
-    return img_bytes
+def _png_chunk(tag, data):
+    """Frame one PNG chunk: length, tag, data, CRC over tag + data."""
+    return (struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(data, zlib.crc32(tag))))
+
+
+PNG_IEND = _png_chunk(b"IEND", b"")
+
+
+@lru_cache(maxsize=None)
+def _png_header(size):
+    """Signature plus IHDR for an 8-bit RGB image; shared by every color."""
+    width, height = size
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", ihdr)
+
+
+@lru_cache(maxsize=None)
+def create_test_png(color=(255, 0, 0), size=(80, 80), compress_level=1):
+    """Create a solid-color RGB PNG image and return its bytes.
+
+    A solid image is one unfiltered scanline repeated, so the PNG is written
+    directly instead of drawing and encoding it with Pillow. ``compress_level``
+    is the zlib level for IDAT; the fixture's own zip deflates the media part
+    again, so a fast level costs next to nothing in file size. Cached per
+    argument set. An Image reads its stream when the workbook is saved, so
+    each one needs its own BytesIO over these bytes.
+    """
+    width, height = size
+    scanline = b"\x00" + bytes(color) * width
+    return b"".join([
+        _png_header(size),
+        _png_chunk(b"IDAT", zlib.compress(scanline * height, compress_level)),
+        PNG_IEND,
+    ])
+
+
+# Shared style objects. openpyxl dedupes styles by value when saving, so
+# building each one once avoids re-validating and re-hashing equal copies.
+BLACK_FONT = Font(color="000000")
+HEADER_BOLD = Font(bold=True, color="000000")
+TITLE_FONT = Font(bold=True, size=14, color="000000")
+WHITE_BOLD = Font(bold=True, color="FFFFFF")
+LINK_FONT = Font(color="0563C1", underline='single')
+BLUE_FILL = PatternFill(start_color="4472C4", fill_type="solid")
+YELLOW_FILL = PatternFill(start_color="FFFF00", fill_type="solid")
+
+# Sample dates for the Data Validation and Number Formats sheets
+DT_JUN_15 = datetime(2024, 6, 15)
+DT_XMAS = datetime(2024, 12, 25)
+DT_XMAS_AM = datetime(2024, 12, 25, 10, 30)
+DT_NEW_YEAR_PM = datetime(2024, 1, 1, 14, 30, 45)
+
+# Conditional formatting highlight fills (differential styles)
+CF_GREEN_FILL = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+CF_RED_FILL = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+CF_YELLOW_FILL = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
+CF_BLUE_FILL = PatternFill(start_color='BDD7EE', end_color='BDD7EE', fill_type='solid')
+
+
+@lru_cache(maxsize=None)
+def _box_border(style, color="000000"):
+    """Return a Border with the same style and color on all four sides."""
+    side = Side(style=style, color=color)
+    return Border(left=side, right=side, top=side, bottom=side)
+
+
+def new_sheet(wb, title, tab_color=None):
+    """Create a write-only sheet, optionally with a tab color.
+
+    Write-only sheets emit <sheetPr>, <sheetView> and <cols> together with
+    the first row, so tab colors, frozen panes and column dimensions have to
+    be set before anything is appended. Row dimensions are read as each row
+    is written. The sheet keeps no max row/column bookkeeping, so it has no
+    <dimension> element; xlview only uses that as a size hint.
+    """
+    ws = wb.create_sheet(title)
+    if tab_color:
+        ws.sheet_properties.tabColor = tab_color
+    return ws
+
+
+def make_cell(ws, value, **attrs):
+    """Create a WriteOnlyCell with the given style/comment/hyperlink attributes."""
+    cell = WriteOnlyCell(ws, value=value)
+    for name, attr in attrs.items():
+        setattr(cell, name, attr)
+    return cell
+
+
+def styled_row(ws, values, **attrs):
+    """Build an append()-ready row, styling every non-empty value the same way."""
+    return [None if value is None else make_cell(ws, value, **attrs) for value in values]
+
+
+def header_row(ws, labels, font=HEADER_BOLD):
+    """Build a row of bold column or section headers."""
+    return styled_row(ws, labels, font=font)
+
+
+def save_workbook(wb, path, compresslevel=1):
+    """Save ``wb`` to ``path`` with its parts deflated at ``compresslevel``.
+
+    openpyxl's writer always uses zlib's default level 6; for a local
+    fixture level 1 is much faster for a slightly larger file. The package is
+    re-packed in memory, written to a temporary file in one write() and
+    moved over ``path``, so a failed run never leaves a partial workbook.
+    """
+    buf = io.BytesIO()
+    wb.save(buf)
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(buf) as src, \
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            dst.writestr(info, src.read(info), zipfile.ZIP_DEFLATED, compresslevel)
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(out.getbuffer())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
 
 def create_kitchen_sink_v3():
-    wb = Workbook()
-    black_font = Font(color="000000")
+    # Write-only mode streams each sheet's rows to a temporary file as they
+    # are appended, the same constant-memory model as xlsxwriter's
+    # constant_memory option, so rows must be appended in order. Rows go
+    # through openpyxl's xmlfile writer (lxml's when installed) without a
+    # cell grid, so hand-writing <sheetData> would not skip any work.
+    wb = Workbook(write_only=True)
 
     # =========================================================================
     # Sheet 1: All 19 Pattern Fills
     # =========================================================================
-    ws1 = wb.active
-    ws1.title = "Pattern Fills"
-    ws1.sheet_properties.tabColor = "4472C4"
+    ws1 = new_sheet(wb, "Pattern Fills", "4472C4")
+    ws1.column_dimensions['A'].width = 18
+    ws1.column_dimensions['B'].width = 15
+    ws1.column_dimensions['C'].width = 25
 
-    ws1['A1'] = "All 19 ECMA-376 Pattern Fill Types"
-    ws1['A1'].font = Font(bold=True, size=14, color="000000")
-    ws1.merge_cells('A1:C1')
+    ws1.append([make_cell(ws1, "All 19 ECMA-376 Pattern Fill Types", font=TITLE_FONT)])
+    ws1.merged_cells.add('A1:C1')
+    ws1.append([])
 
     # All pattern types per ECMA-376 specification
     pattern_types = [
@@ -100,37 +230,30 @@ def create_kitchen_sink_v3():
         ("gray0625", "Gray 6.25%"),
     ]
 
-    ws1['A3'] = "Pattern"
-    ws1['B3'] = "Sample"
-    ws1['C3'] = "Description"
-    ws1['A3'].font = Font(bold=True, color="000000")
-    ws1['B3'].font = Font(bold=True, color="000000")
-    ws1['C3'].font = Font(bold=True, color="000000")
-
-    for i, (pattern, desc) in enumerate(pattern_types, 4):
-        ws1[f'A{i}'] = pattern
-        ws1[f'A{i}'].font = black_font
-        ws1[f'B{i}'].fill = PatternFill(
-            start_color="4472C4",
-            end_color="FFFFFF",
-            fill_type=pattern
-        )
-        ws1[f'C{i}'] = desc
-        ws1[f'C{i}'].font = black_font
+    ws1.append(header_row(ws1, ["Pattern", "Sample", "Description"]))
 
-    ws1.column_dimensions['A'].width = 18
-    ws1.column_dimensions['B'].width = 15
-    ws1.column_dimensions['C'].width = 25
+    for pattern, desc in pattern_types:
+        ws1.append([
+            make_cell(ws1, pattern, font=BLACK_FONT),
+            make_cell(ws1, None, fill=PatternFill(
+                start_color="4472C4",
+                end_color="FFFFFF",
+                fill_type=pattern
+            )),
+            make_cell(ws1, desc, font=BLACK_FONT),
+        ])
 
     # =========================================================================
     # Sheet 2: All 13 Border Styles
     # =========================================================================
-    ws2 = wb.create_sheet("Border Styles")
-    ws2.sheet_properties.tabColor = "70AD47"
+    ws2 = new_sheet(wb, "Border Styles", "70AD47")
+    ws2.column_dimensions['A'].width = 20
+    ws2.column_dimensions['B'].width = 15
+    ws2.column_dimensions['C'].width = 25
 
-    ws2['A1'] = "All 13 ECMA-376 Border Styles"
-    ws2['A1'].font = Font(bold=True, size=14, color="000000")
-    ws2.merge_cells('A1:C1')
+    ws2.append([make_cell(ws2, "All 13 ECMA-376 Border Styles", font=TITLE_FONT)])
+    ws2.merged_cells.add('A1:C1')
+    ws2.append([])
 
     # All border styles per ECMA-376 specification
     border_styles = [
@@ -150,240 +273,152 @@ def create_kitchen_sink_v3():
         ("slantDashDot", "Slant dash dot"),
     ]
 
-    ws2['A3'] = "Style"
-    ws2['B3'] = "Sample"
-    ws2['C3'] = "Description"
-    ws2['A3'].font = Font(bold=True, color="000000")
-    ws2['B3'].font = Font(bold=True, color="000000")
-    ws2['C3'].font = Font(bold=True, color="000000")
+    ws2.append(header_row(ws2, ["Style", "Sample", "Description"]))
 
-    for i, (style, desc) in enumerate(border_styles, 4):
-        ws2[f'A{i}'] = style
-        ws2[f'A{i}'].font = black_font
+    for style, desc in border_styles:
+        sample = make_cell(ws2, "Sample", font=BLACK_FONT)
         if style != "none":
-            border = Border(
-                left=Side(style=style, color="000000"),
-                right=Side(style=style, color="000000"),
-                top=Side(style=style, color="000000"),
-                bottom=Side(style=style, color="000000")
-            )
-            ws2[f'B{i}'].border = border
-        ws2[f'B{i}'] = "Sample"
-        ws2[f'B{i}'].font = black_font
-        ws2[f'C{i}'] = desc
-        ws2[f'C{i}'].font = black_font
-
-    # Add colored border examples
-    ws2['A20'] = "Colored Borders"
-    ws2['A20'].font = Font(bold=True, color="000000")
+            sample.border = _box_border(style)
+        ws2.append([
+            make_cell(ws2, style, font=BLACK_FONT),
+            sample,
+            make_cell(ws2, desc, font=BLACK_FONT),
+        ])
+
+    # Add colored border examples in rows 20-24
+    ws2.append([])
+    ws2.append([])
+    ws2.append(header_row(ws2, ["Colored Borders"]))
 
     colors = [("FF0000", "Red"), ("00FF00", "Green"), ("0000FF", "Blue"), ("FFC000", "Orange")]
-    for i, (color, name) in enumerate(colors, 21):
-        ws2[f'A{i}'] = name
-        ws2[f'A{i}'].font = black_font
-        ws2[f'B{i}'].border = Border(
-            left=Side(style='thick', color=color),
-            right=Side(style='thick', color=color),
-            top=Side(style='thick', color=color),
-            bottom=Side(style='thick', color=color)
-        )
-        ws2[f'B{i}'] = "Color"
-        ws2[f'B{i}'].font = black_font
-
-    ws2.column_dimensions['A'].width = 20
-    ws2.column_dimensions['B'].width = 15
-    ws2.column_dimensions['C'].width = 25
+    for color, name in colors:
+        ws2.append([
+            make_cell(ws2, name, font=BLACK_FONT),
+            make_cell(ws2, "Color", font=BLACK_FONT, border=_box_border('thick', color)),
+        ])
 
     # =========================================================================
     # Sheet 3: All Conditional Formatting Types
     # =========================================================================
-    ws3 = wb.create_sheet("Conditional Formatting")
-    ws3.sheet_properties.tabColor = "ED7D31"
-
-    ws3['A1'] = "All Conditional Formatting Types"
-    ws3['A1'].font = Font(bold=True, size=14, color="000000")
-    ws3.merge_cells('A1:G1')
+    ws3 = new_sheet(wb, "Conditional Formatting", "ED7D31")
+
+    ws3.append([make_cell(ws3, "All Conditional Formatting Types", font=TITLE_FONT)])
+    ws3.merged_cells.add('A1:G1')
+    ws3.append([])
+
+    # One rule type per column in rows 3-8: a header, then five values
+    ws3.append(header_row(ws3, ["2-Color Scale", "Data Bars", "3 Arrows", "3 Traffic Lights",
+                                "4 Arrows", "5 Ratings", "Cell Is Rules"]))
+    columns = [
+        [10, 30, 50, 70, 90],
+        [20, 40, 60, 80, 100],
+        [10, 40, 70, 30, 90],
+        [1, 2, 3, 2, 1],
+        [15, 35, 65, 85, 50],
+        [1, 2, 3, 4, 5],
+        [10, 40, 60, 25, 80],
+    ]
+    for row in zip(*columns):
+        ws3.append(row)
+    ws3.append([])
 
-    row = 3
+    # Second block in rows 10-15
+    ws3.append(header_row(ws3, ["3-Color Scale", "Gradient Data Bars"]))
+    for row in zip([0, 25, 50, 75, 100], [15, 45, 75, 95, 35]):
+        ws3.append(row)
+    ws3.append([])
 
     # 2-Color Scale
-    ws3[f'A{row}'] = "2-Color Scale"
-    ws3[f'A{row}'].font = Font(bold=True, color="000000")
-    for i, val in enumerate([10, 30, 50, 70, 90], row + 1):
-        ws3[f'A{i}'] = val
     ws3.conditional_formatting.add(
-        f'A{row+1}:A{row+5}',
+        'A4:A8',
         ColorScaleRule(
             start_type='min', start_color='FF0000',
             end_type='max', end_color='00FF00'
         )
     )
-    row += 7
 
     # 3-Color Scale
-    ws3[f'A{row}'] = "3-Color Scale"
-    ws3[f'A{row}'].font = Font(bold=True, color="000000")
-    for i, val in enumerate([0, 25, 50, 75, 100], row + 1):
-        ws3[f'A{i}'] = val
     ws3.conditional_formatting.add(
-        f'A{row+1}:A{row+5}',
+        'A11:A15',
         ColorScaleRule(
             start_type='min', start_color='F8696B',
             mid_type='percentile', mid_value=50, mid_color='FFEB84',
             end_type='max', end_color='63BE7B'
         )
     )
-    row += 7
 
-    # Data Bars
-    ws3[f'B3'] = "Data Bars"
-    ws3[f'B3'].font = Font(bold=True, color="000000")
-    for i, val in enumerate([20, 40, 60, 80, 100], 4):
-        ws3[f'B{i}'] = val
-    ws3.conditional_formatting.add(
-        'B4:B8',
-        DataBarRule(
-            start_type='min', end_type='max',
-            color='4472C4', showValue=True,
-            minLength=None, maxLength=None
-        )
-    )
-
-    # Gradient Data Bars
-    ws3['B10'] = "Gradient Data Bars"
-    ws3['B10'].font = Font(bold=True, color="000000")
-    for i, val in enumerate([15, 45, 75, 95, 35], 11):
-        ws3[f'B{i}'] = val
-    ws3.conditional_formatting.add(
-        'B11:B15',
-        DataBarRule(
-            start_type='min', end_type='max',
-            color='70AD47', showValue=True,
-            minLength=None, maxLength=None
+    # Data Bars (B4:B8) and Gradient Data Bars (B11:B15)
+    for sqref, color in [('B4:B8', '4472C4'), ('B11:B15', '70AD47')]:
+        ws3.conditional_formatting.add(
+            sqref,
+            DataBarRule(
+                start_type='min', end_type='max',
+                color=color, showValue=True,
+                minLength=None, maxLength=None
+            )
         )
-    )
-
-    # Icon Sets - 3 Arrows
-    ws3['C3'] = "3 Arrows"
-    ws3['C3'].font = Font(bold=True, color="000000")
-    for i, val in enumerate([10, 40, 70, 30, 90], 4):
-        ws3[f'C{i}'] = val
-    ws3.conditional_formatting.add(
-        'C4:C8',
-        IconSetRule(icon_style='3Arrows', type='percent', values=[0, 33, 67])
-    )
 
-    # Icon Sets - 3 Traffic Lights
-    ws3['D3'] = "3 Traffic Lights"
-    ws3['D3'].font = Font(bold=True, color="000000")
-    for i, val in enumerate([1, 2, 3, 2, 1], 4):
-        ws3[f'D{i}'] = val
-    ws3.conditional_formatting.add(
-        'D4:D8',
-        IconSetRule(icon_style='3TrafficLights1', type='num', values=[0, 2, 3])
-    )
-
-    # Icon Sets - 4 Arrows
-    ws3['E3'] = "4 Arrows"
-    ws3['E3'].font = Font(bold=True, color="000000")
-    for i, val in enumerate([15, 35, 65, 85, 50], 4):
-        ws3[f'E{i}'] = val
-    ws3.conditional_formatting.add(
-        'E4:E8',
-        IconSetRule(icon_style='4Arrows', type='percent', values=[0, 25, 50, 75])
-    )
-
-    # Icon Sets - 5 Ratings
-    ws3['F3'] = "5 Ratings"
-    ws3['F3'].font = Font(bold=True, color="000000")
-    for i, val in enumerate([1, 2, 3, 4, 5], 4):
-        ws3[f'F{i}'] = val
-    ws3.conditional_formatting.add(
-        'F4:F8',
-        IconSetRule(icon_style='5Rating', type='num', values=[0, 1, 2, 3, 4])
-    )
-
-    # Cell Is rules
-    ws3['G3'] = "Cell Is Rules"
-    ws3['G3'].font = Font(bold=True, color="000000")
-    for i, val in enumerate([10, 40, 60, 25, 80], 4):
-        ws3[f'G{i}'] = val
-
-    # Greater than 50 = green
-    ws3.conditional_formatting.add(
-        'G4:G8',
-        CellIsRule(
-            operator='greaterThan', formula=['50'],
-            fill=PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+    # Icon Sets: 3 Arrows, 3 Traffic Lights, 4 Arrows and 5 Ratings
+    icon_specs = [
+        ('C4:C8', '3Arrows', 'percent', [0, 33, 67]),
+        ('D4:D8', '3TrafficLights1', 'num', [0, 2, 3]),
+        ('E4:E8', '4Arrows', 'percent', [0, 25, 50, 75]),
+        ('F4:F8', '5Rating', 'num', [0, 1, 2, 3, 4]),
+    ]
+    for sqref, icon_style, type_, values in icon_specs:
+        ws3.conditional_formatting.add(
+            sqref, IconSetRule(icon_style=icon_style, type=type_, values=values)
         )
-    )
 
-    # Less than 30 = red
-    ws3.conditional_formatting.add(
-        'G4:G8',
-        CellIsRule(
-            operator='lessThan', formula=['30'],
-            fill=PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-        )
-    )
+    # Cell Is rules: greater than 50 = green, less than 30 = red. Both share
+    # one range, so they are written as one <conditionalFormatting> node.
+    for rule in (
+        CellIsRule(operator='greaterThan', formula=['50'], fill=CF_GREEN_FILL),
+        CellIsRule(operator='lessThan', formula=['30'], fill=CF_RED_FILL),
+    ):
+        ws3.conditional_formatting.add('G4:G8', rule)
 
     # More Cell Is rules
-    ws3['A17'] = "More Cell Is Operators"
-    ws3['A17'].font = Font(bold=True, color="000000")
-    ws3.merge_cells('A17:E17')
+    ws3.append(header_row(ws3, ["More Cell Is Operators"]))
+    ws3.merged_cells.add('A17:E17')
+
+    ws3.append(styled_row(ws3, ["Equal to 50", "Between 30-70"], font=BLACK_FONT))
+    for row in zip([30, 50, 50, 70, 50], [20, 40, 60, 80, 35]):
+        ws3.append(row)
 
     # Equal to
-    ws3['A18'] = "Equal to 50"
-    ws3['A18'].font = black_font
-    for i, val in enumerate([30, 50, 50, 70, 50], 19):
-        ws3[f'A{i}'] = val
     ws3.conditional_formatting.add(
         'A19:A23',
-        CellIsRule(
-            operator='equal', formula=['50'],
-            fill=PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-        )
+        CellIsRule(operator='equal', formula=['50'], fill=CF_YELLOW_FILL)
     )
 
     # Between
-    ws3['B18'] = "Between 30-70"
-    ws3['B18'].font = black_font
-    for i, val in enumerate([20, 40, 60, 80, 35], 19):
-        ws3[f'B{i}'] = val
     ws3.conditional_formatting.add(
         'B19:B23',
-        CellIsRule(
-            operator='between', formula=['30', '70'],
-            fill=PatternFill(start_color='BDD7EE', end_color='BDD7EE', fill_type='solid')
-        )
+        CellIsRule(operator='between', formula=['30', '70'], fill=CF_BLUE_FILL)
     )
 
     # =========================================================================
     # Sheet 4: All Chart Types
     # =========================================================================
-    ws4 = wb.create_sheet("Charts")
-    ws4.sheet_properties.tabColor = "FFC000"
-
-    # Chart data
-    ws4['A1'] = "Category"
-    ws4['B1'] = "Series 1"
-    ws4['C1'] = "Series 2"
-    ws4['D1'] = "Series 3"
+    ws4 = new_sheet(wb, "Charts", "FFC000")
 
+    # Chart data in A:D, pie data in G:H and scatter data in J:K
     categories = ["Q1", "Q2", "Q3", "Q4"]
     data1 = [10, 25, 15, 30]
     data2 = [20, 15, 25, 20]
     data3 = [15, 30, 20, 25]
+    pie_data = [("Widgets", 35), ("Gadgets", 25), ("Gizmos", 20), ("Things", 20)]
+    scatter_data = [(1, 2), (2, 5), (3, 3), (4, 7), (5, 4)]
 
-    for i, (cat, d1, d2, d3) in enumerate(zip(categories, data1, data2, data3), 2):
-        ws4[f'A{i}'] = cat
-        ws4[f'B{i}'] = d1
-        ws4[f'C{i}'] = d2
-        ws4[f'D{i}'] = d3
+    header = styled_row(ws4, ["Category", "Series 1", "Series 2", "Series 3"],
+                        font=WHITE_BOLD, fill=BLUE_FILL)
+    ws4.append(header + [None, None, "Product", "Sales", None, "X", "Y"])
 
-    for col in ['A', 'B', 'C', 'D']:
-        ws4[f'{col}1'].font = Font(bold=True, color="FFFFFF")
-        ws4[f'{col}1'].fill = PatternFill(start_color="4472C4", fill_type="solid")
+    # One precomputed row per line; the scatter block runs a row longer
+    series_rows = zip(categories, data1, data2, data3)
+    for series, pie, xy in zip_longest(series_rows, pie_data, scatter_data, fillvalue=()):
+        ws4.append([*(series or (None,) * 4), None, None, *(pie or (None, None)), None, *xy])
 
     # Data references
     data_ref = Reference(ws4, min_col=2, min_row=1, max_col=4, max_row=5)
@@ -420,14 +455,6 @@ def create_kitchen_sink_v3():
     area_chart.set_categories(cats_ref)
     ws4.add_chart(area_chart, "P17")
 
-    # Pie chart data
-    ws4['G1'] = "Product"
-    ws4['H1'] = "Sales"
-    pie_data = [("Widgets", 35), ("Gadgets", 25), ("Gizmos", 20), ("Things", 20)]
-    for i, (prod, sales) in enumerate(pie_data, 2):
-        ws4[f'G{i}'] = prod
-        ws4[f'H{i}'] = sales
-
     # 5. Pie Chart
     pie_chart = PieChart()
     pie_chart.title = "Pie Chart"
@@ -444,14 +471,6 @@ def create_kitchen_sink_v3():
     doughnut.set_categories(pie_cats)
     ws4.add_chart(doughnut, "P32")
 
-    # Scatter data
-    ws4['J1'] = "X"
-    ws4['K1'] = "Y"
-    scatter_data = [(1, 2), (2, 5), (3, 3), (4, 7), (5, 4)]
-    for i, (x, y) in enumerate(scatter_data, 2):
-        ws4[f'J{i}'] = x
-        ws4[f'K{i}'] = y
-
     # 7. Scatter Chart
     scatter = ScatterChart()
     scatter.title = "Scatter Chart"
@@ -471,118 +490,110 @@ def create_kitchen_sink_v3():
     # =========================================================================
     # Sheet 5: Data Validation
     # =========================================================================
-    ws5 = wb.create_sheet("Data Validation")
-    ws5.sheet_properties.tabColor = "9966FF"
+    ws5 = new_sheet(wb, "Data Validation", "9966FF")
+    ws5.column_dimensions['A'].width = 25
+    ws5.column_dimensions['B'].width = 20
 
-    ws5['A1'] = "All Data Validation Types"
-    ws5['A1'].font = Font(bold=True, size=14, color="000000")
-    ws5.merge_cells('A1:C1')
+    ws5.append([make_cell(ws5, "All Data Validation Types", font=TITLE_FONT)])
+    ws5.merged_cells.add('A1:C1')
+    ws5.append([])
 
     # List validation
-    ws5['A3'] = "List (dropdown):"
-    ws5['A3'].font = black_font
     dv_list = DataValidation(
         type="list",
         formula1='"Option A,Option B,Option C,Option D"',
         allow_blank=True,
-        showDropDown=False
+        showDropDown=False,
+        sqref='B3'
     )
-    ws5.add_data_validation(dv_list)
-    dv_list.add('B3')
-    ws5['B3'] = "Option A"
+    ws5.data_validations.append(dv_list)
+    ws5.append([make_cell(ws5, "List (dropdown):", font=BLACK_FONT), "Option A"])
+    ws5.append([])
 
     # Whole number validation
-    ws5['A5'] = "Whole number (1-100):"
-    ws5['A5'].font = black_font
     dv_whole = DataValidation(
         type="whole",
         operator="between",
         formula1="1",
-        formula2="100"
+        formula2="100",
+        sqref='B5'
     )
     dv_whole.error = "Please enter a number between 1 and 100"
     dv_whole.errorTitle = "Invalid Input"
-    ws5.add_data_validation(dv_whole)
-    dv_whole.add('B5')
-    ws5['B5'] = 50
+    ws5.data_validations.append(dv_whole)
+    ws5.append([make_cell(ws5, "Whole number (1-100):", font=BLACK_FONT), 50])
+    ws5.append([])
 
     # Decimal validation
-    ws5['A7'] = "Decimal (0.0-10.0):"
-    ws5['A7'].font = black_font
     dv_decimal = DataValidation(
         type="decimal",
         operator="between",
         formula1="0",
-        formula2="10"
+        formula2="10",
+        sqref='B7'
     )
-    ws5.add_data_validation(dv_decimal)
-    dv_decimal.add('B7')
-    ws5['B7'] = 5.5
+    ws5.data_validations.append(dv_decimal)
+    ws5.append([make_cell(ws5, "Decimal (0.0-10.0):", font=BLACK_FONT), 5.5])
+    ws5.append([])
 
     # Date validation
-    ws5['A9'] = "Date (2024+):"
-    ws5['A9'].font = black_font
     dv_date = DataValidation(
         type="date",
         operator="greaterThanOrEqual",
-        formula1="2024-01-01"
+        formula1="2024-01-01",
+        sqref='B9'
     )
-    ws5.add_data_validation(dv_date)
-    dv_date.add('B9')
-    ws5['B9'] = datetime(2024, 6, 15)
+    ws5.data_validations.append(dv_date)
+    ws5.append([make_cell(ws5, "Date (2024+):", font=BLACK_FONT), DT_JUN_15])
+    ws5.append([])
 
     # Text length validation
-    ws5['A11'] = "Text length (max 20):"
-    ws5['A11'].font = black_font
     dv_text = DataValidation(
         type="textLength",
         operator="lessThanOrEqual",
-        formula1="20"
+        formula1="20",
+        sqref='B11'
     )
-    ws5.add_data_validation(dv_text)
-    dv_text.add('B11')
-    ws5['B11'] = "Short text"
+    ws5.data_validations.append(dv_text)
+    ws5.append([make_cell(ws5, "Text length (max 20):", font=BLACK_FONT), "Short text"])
+    ws5.append([])
 
     # Yes/No dropdown
-    ws5['A13'] = "Yes/No:"
-    ws5['A13'].font = black_font
     dv_yesno = DataValidation(
         type="list",
         formula1='"Yes,No"',
-        showDropDown=False
+        showDropDown=False,
+        sqref='B13'
     )
-    ws5.add_data_validation(dv_yesno)
-    dv_yesno.add('B13')
-    ws5['B13'] = "Yes"
+    ws5.data_validations.append(dv_yesno)
+    ws5.append([make_cell(ws5, "Yes/No:", font=BLACK_FONT), "Yes"])
+    ws5.append([])
 
     # Priority dropdown
-    ws5['A15'] = "Priority:"
-    ws5['A15'].font = black_font
     dv_priority = DataValidation(
         type="list",
         formula1='"Critical,High,Medium,Low"',
-        showDropDown=False
+        showDropDown=False,
+        sqref='B15'
     )
-    ws5.add_data_validation(dv_priority)
-    dv_priority.add('B15')
-    ws5['B15'] = "Medium"
-
-    ws5.column_dimensions['A'].width = 25
-    ws5.column_dimensions['B'].width = 20
+    ws5.data_validations.append(dv_priority)
+    ws5.append([make_cell(ws5, "Priority:", font=BLACK_FONT), "Medium"])
 
     # =========================================================================
     # Sheet 6: Font Styles & Rich Text
     # =========================================================================
-    ws6 = wb.create_sheet("Fonts & Rich Text")
-    ws6.sheet_properties.tabColor = "FF6B6B"
+    ws6 = new_sheet(wb, "Fonts & Rich Text", "FF6B6B")
+    ws6.column_dimensions['A'].width = 20
+    ws6.column_dimensions['B'].width = 15
+    ws6.column_dimensions['C'].width = 15
 
-    ws6['A1'] = "Font Styles and Rich Text"
-    ws6['A1'].font = Font(bold=True, size=14, color="000000")
-    ws6.merge_cells('A1:C1')
+    ws6.append([make_cell(ws6, "Font Styles and Rich Text", font=TITLE_FONT)])
+    ws6.merged_cells.add('A1:C1')
+    ws6.append([])
 
     # Font styles
     styles = [
-        ("Bold", Font(bold=True, color="000000")),
+        ("Bold", HEADER_BOLD),
         ("Italic", Font(italic=True, color="000000")),
         ("Underline", Font(underline='single', color="000000")),
         ("Double Underline", Font(underline='double', color="000000")),
@@ -592,21 +603,8 @@ def create_kitchen_sink_v3():
         ("Superscript", Font(vertAlign='superscript', color="000000")),
     ]
 
-    for i, (name, font) in enumerate(styles, 3):
-        ws6[f'A{i}'] = name
-        ws6[f'A{i}'].font = font
-
     # Font sizes
-    ws6['B3'] = "Size 8"
-    ws6['B3'].font = Font(size=8, color="000000")
-    ws6['B4'] = "Size 11"
-    ws6['B4'].font = Font(size=11, color="000000")
-    ws6['B5'] = "Size 14"
-    ws6['B5'].font = Font(size=14, color="000000")
-    ws6['B6'] = "Size 18"
-    ws6['B6'].font = Font(size=18, color="000000")
-    ws6['B7'] = "Size 24"
-    ws6['B7'].font = Font(size=24, color="000000")
+    sizes = [8, 11, 14, 18, 24]
 
     # Font colors
     colors = [
@@ -617,164 +615,131 @@ def create_kitchen_sink_v3():
         ("Purple", "7030A0"),
     ]
 
-    for i, (name, color) in enumerate(colors, 3):
-        ws6[f'C{i}'] = name
-        ws6[f'C{i}'].font = Font(color=color)
+    # Styles in A, sizes in B and colors in C, starting at row 3
+    style_cells = [make_cell(ws6, name, font=font) for name, font in styles]
+    size_cells = [make_cell(ws6, f"Size {size}", font=Font(size=size, color="000000"))
+                  for size in sizes]
+    color_cells = [make_cell(ws6, name, font=Font(color=color)) for name, color in colors]
+    for row in zip_longest(style_cells, size_cells, color_cells):
+        ws6.append(row)
+    ws6.append([])
 
     # Font families
     fonts = ["Arial", "Times New Roman", "Courier New", "Verdana", "Georgia"]
-    for i, font_name in enumerate(fonts, 12):
-        ws6[f'A{i}'] = font_name
-        ws6[f'A{i}'].font = Font(name=font_name, color="000000")
-
-    ws6.column_dimensions['A'].width = 20
-    ws6.column_dimensions['B'].width = 15
-    ws6.column_dimensions['C'].width = 15
+    for font_name in fonts:
+        ws6.append([make_cell(ws6, font_name, font=Font(name=font_name, color="000000"))])
 
     # =========================================================================
     # Sheet 7: Alignment
     # =========================================================================
-    ws7 = wb.create_sheet("Alignment")
-    ws7.sheet_properties.tabColor = "00B0F0"
+    ws7 = new_sheet(wb, "Alignment", "00B0F0")
+    ws7.column_dimensions['A'].width = 25
+    ws7.column_dimensions['B'].width = 15
+    ws7.column_dimensions['C'].width = 15
+    ws7.column_dimensions['D'].width = 20
 
-    ws7['A1'] = "Alignment Options"
-    ws7['A1'].font = Font(bold=True, size=14, color="000000")
-    ws7.merge_cells('A1:D1')
+    ws7.append([make_cell(ws7, "Alignment Options", font=TITLE_FONT)])
+    ws7.merged_cells.add('A1:D1')
+    ws7.append([])
 
-    # Horizontal alignment
-    ws7['A3'] = "Horizontal:"
-    ws7['A3'].font = Font(bold=True, color="000000")
+    ws7.append(header_row(ws7, ["Horizontal:", "Vertical:", "Rotation:", "Other:"]))
 
+    # Horizontal alignment
     h_aligns = ["left", "center", "right", "fill", "justify", "distributed"]
-    for i, align in enumerate(h_aligns, 4):
-        ws7[f'A{i}'] = f"H: {align}"
-        ws7[f'A{i}'].font = black_font
-        ws7[f'A{i}'].alignment = Alignment(horizontal=align)
-    ws7.column_dimensions['A'].width = 25
-
-    # Vertical alignment
-    ws7['B3'] = "Vertical:"
-    ws7['B3'].font = Font(bold=True, color="000000")
+    h_cells = [
+        make_cell(ws7, f"H: {align}", font=BLACK_FONT, alignment=Alignment(horizontal=align))
+        for align in h_aligns
+    ]
 
+    # Vertical alignment, in taller rows
     v_aligns = ["top", "center", "bottom", "justify", "distributed"]
-    for i, align in enumerate(v_aligns, 4):
-        ws7[f'B{i}'] = f"V: {align}"
-        ws7[f'B{i}'].font = black_font
-        ws7[f'B{i}'].alignment = Alignment(vertical=align)
+    v_cells = [
+        make_cell(ws7, f"V: {align}", font=BLACK_FONT, alignment=Alignment(vertical=align))
+        for align in v_aligns
+    ]
+    for i in range(4, 4 + len(v_aligns)):
         ws7.row_dimensions[i].height = 40
 
     # Text rotation
-    ws7['C3'] = "Rotation:"
-    ws7['C3'].font = Font(bold=True, color="000000")
-
     rotations = [0, 45, 90, 135, 180, 255]  # 255 = vertical text
-    for i, rot in enumerate(rotations, 4):
-        ws7[f'C{i}'] = f"Rot: {rot}"
-        ws7[f'C{i}'].font = black_font
-        ws7[f'C{i}'].alignment = Alignment(textRotation=rot)
+    rot_cells = [
+        make_cell(ws7, f"Rot: {rot}", font=BLACK_FONT, alignment=Alignment(textRotation=rot))
+        for rot in rotations
+    ]
 
     # Wrap text and indent
-    ws7['D3'] = "Other:"
-    ws7['D3'].font = Font(bold=True, color="000000")
-
-    ws7['D4'] = "This is a long text that should wrap to multiple lines in the cell"
-    ws7['D4'].font = black_font
-    ws7['D4'].alignment = Alignment(wrap_text=True)
-
-    ws7['D5'] = "Indent 1"
-    ws7['D5'].font = black_font
-    ws7['D5'].alignment = Alignment(indent=1)
-
-    ws7['D6'] = "Indent 2"
-    ws7['D6'].font = black_font
-    ws7['D6'].alignment = Alignment(indent=2)
-
-    ws7['D7'] = "Indent 3"
-    ws7['D7'].font = black_font
-    ws7['D7'].alignment = Alignment(indent=3)
+    other_cells = [
+        make_cell(ws7, "This is a long text that should wrap to multiple lines in the cell",
+                  font=BLACK_FONT, alignment=Alignment(wrap_text=True)),
+        make_cell(ws7, "Indent 1", font=BLACK_FONT, alignment=Alignment(indent=1)),
+        make_cell(ws7, "Indent 2", font=BLACK_FONT, alignment=Alignment(indent=2)),
+        make_cell(ws7, "Indent 3", font=BLACK_FONT, alignment=Alignment(indent=3)),
+        make_cell(ws7, "Shrink to fit", font=BLACK_FONT, alignment=Alignment(shrink_to_fit=True)),
+    ]
 
-    ws7['D8'] = "Shrink to fit"
-    ws7['D8'].font = black_font
-    ws7['D8'].alignment = Alignment(shrink_to_fit=True)
-
-    ws7.column_dimensions['B'].width = 15
-    ws7.column_dimensions['C'].width = 15
-    ws7.column_dimensions['D'].width = 20
+    for row in zip_longest(h_cells, v_cells, rot_cells, other_cells):
+        ws7.append(row)
 
     # =========================================================================
     # Sheet 8: Comments & Hyperlinks
     # =========================================================================
-    ws8 = wb.create_sheet("Comments & Links")
-    ws8.sheet_properties.tabColor = "A5A5A5"
+    ws8 = new_sheet(wb, "Comments & Links", "A5A5A5")
+    ws8.column_dimensions['A'].width = 25
 
-    ws8['A1'] = "Comments and Hyperlinks"
-    ws8['A1'].font = Font(bold=True, size=14, color="000000")
-    ws8.merge_cells('A1:C1')
+    ws8.append([make_cell(ws8, "Comments and Hyperlinks", font=TITLE_FONT)])
+    ws8.merged_cells.add('A1:C1')
+    ws8.append([])
 
     # Comments
-    ws8['A3'] = "Cell with comment"
-    ws8['A3'].font = black_font
-    ws8['A3'].comment = Comment("This is a comment!\nLine 2 of comment.", "Author Name")
-
-    ws8['A4'] = "Another comment"
-    ws8['A4'].font = black_font
-    ws8['A4'].comment = Comment("Important note here.", "Reviewer")
-
-    ws8['A5'] = "Long comment"
-    ws8['A5'].font = black_font
-    ws8['A5'].comment = Comment(
-        "This is a much longer comment that contains multiple paragraphs.\n\n"
-        "Paragraph 2: More details about this cell.\n\n"
-        "Paragraph 3: Final notes.",
-        "Documentation Team"
-    )
+    ws8.append([make_cell(
+        ws8, "Cell with comment", font=BLACK_FONT,
+        comment=Comment("This is a comment!\nLine 2 of comment.", "Author Name")
+    )])
+    ws8.append([make_cell(
+        ws8, "Another comment", font=BLACK_FONT,
+        comment=Comment("Important note here.", "Reviewer")
+    )])
+    ws8.append([make_cell(
+        ws8, "Long comment", font=BLACK_FONT,
+        comment=Comment(
+            "This is a much longer comment that contains multiple paragraphs.\n\n"
+            "Paragraph 2: More details about this cell.\n\n"
+            "Paragraph 3: Final notes.",
+            "Documentation Team"
+        )
+    )])
+    ws8.append([])
 
     # Hyperlinks
-    ws8['A7'] = "External Links:"
-    ws8['A7'].font = Font(bold=True, color="000000")
-
-    ws8['A8'] = "Google"
-    ws8['A8'].hyperlink = "https://www.google.com"
-    ws8['A8'].font = Font(color="0563C1", underline='single')
-
-    ws8['A9'] = "GitHub"
-    ws8['A9'].hyperlink = "https://github.com"
-    ws8['A9'].font = Font(color="0563C1", underline='single')
-
-    ws8['A10'] = "Email Link"
-    ws8['A10'].hyperlink = "mailto:test@example.com"
-    ws8['A10'].font = Font(color="0563C1", underline='single')
+    ws8.append(header_row(ws8, ["External Links:"]))
+    ws8.append([make_cell(ws8, "Google", hyperlink="https://www.google.com",
+                          font=LINK_FONT)])
+    ws8.append([make_cell(ws8, "GitHub", hyperlink="https://github.com",
+                          font=LINK_FONT)])
+    ws8.append([make_cell(ws8, "Email Link", hyperlink="mailto:test@example.com",
+                          font=LINK_FONT)])
+    ws8.append([])
 
     # Internal links
-    ws8['A12'] = "Internal Links:"
-    ws8['A12'].font = Font(bold=True, color="000000")
-
-    ws8['A13'] = "Go to Charts"
-    ws8['A13'].hyperlink = "#Charts!A1"
-    ws8['A13'].font = Font(color="0563C1", underline='single')
-
-    ws8['A14'] = "Go to Pattern Fills"
-    ws8['A14'].hyperlink = "#'Pattern Fills'!A1"
-    ws8['A14'].font = Font(color="0563C1", underline='single')
-
-    ws8.column_dimensions['A'].width = 25
+    ws8.append(header_row(ws8, ["Internal Links:"]))
+    ws8.append([make_cell(ws8, "Go to Charts", hyperlink="#Charts!A1",
+                          font=LINK_FONT)])
+    ws8.append([make_cell(ws8, "Go to Pattern Fills", hyperlink="#'Pattern Fills'!A1",
+                          font=LINK_FONT)])
 
     # =========================================================================
     # Sheet 9: Number Formats
     # =========================================================================
-    ws9 = wb.create_sheet("Number Formats")
-    ws9.sheet_properties.tabColor = "CC99FF"
+    ws9 = new_sheet(wb, "Number Formats", "CC99FF")
+    ws9.column_dimensions['A'].width = 25
+    ws9.column_dimensions['B'].width = 20
+    ws9.column_dimensions['C'].width = 25
 
-    ws9['A1'] = "Number Formats"
-    ws9['A1'].font = Font(bold=True, size=14, color="000000")
-    ws9.merge_cells('A1:C1')
+    ws9.append([make_cell(ws9, "Number Formats", font=TITLE_FONT)])
+    ws9.merged_cells.add('A1:C1')
+    ws9.append([])
 
-    ws9['A3'] = "Format"
-    ws9['B3'] = "Value"
-    ws9['C3'] = "Display"
-    ws9['A3'].font = Font(bold=True, color="000000")
-    ws9['B3'].font = Font(bold=True, color="000000")
-    ws9['C3'].font = Font(bold=True, color="000000")
+    ws9.append(header_row(ws9, ["Format", "Value", "Display"]))
 
     formats = [
         ("General", 1234.5678, None),
@@ -786,112 +751,102 @@ def create_kitchen_sink_v3():
         ("Percentage", 0.756, '0.00%'),
         ("Scientific", 123456789, '0.00E+00'),
         ("Fraction", 0.5, '# ?/?'),
-        ("Date", datetime(2024, 12, 25), 'YYYY-MM-DD'),
-        ("Date long", datetime(2024, 12, 25), 'MMMM D, YYYY'),
-        ("Time", datetime(2024, 1, 1, 14, 30, 45), 'HH:MM:SS'),
-        ("DateTime", datetime(2024, 12, 25, 10, 30), 'YYYY-MM-DD HH:MM'),
+        ("Date", DT_XMAS, 'YYYY-MM-DD'),
+        ("Date long", DT_XMAS, 'MMMM D, YYYY'),
+        ("Time", DT_NEW_YEAR_PM, 'HH:MM:SS'),
+        ("DateTime", DT_XMAS_AM, 'YYYY-MM-DD HH:MM'),
         ("Text", 12345, '@'),
         ("Custom", 12345.67, '[Blue]#,##0.00'),
     ]
 
-    for i, (name, value, fmt) in enumerate(formats, 4):
-        ws9[f'A{i}'] = name
-        ws9[f'A{i}'].font = black_font
-        ws9[f'B{i}'] = value
-        ws9[f'B{i}'].font = black_font
-        ws9[f'C{i}'] = value
-        ws9[f'C{i}'].font = black_font
+    for name, value, fmt in formats:
+        display = make_cell(ws9, value, font=BLACK_FONT)
         if fmt:
-            ws9[f'C{i}'].number_format = fmt
-
-    ws9.column_dimensions['A'].width = 25
-    ws9.column_dimensions['B'].width = 20
-    ws9.column_dimensions['C'].width = 25
+            display.number_format = fmt
+        ws9.append(styled_row(ws9, [name, value], font=BLACK_FONT) + [display])
 
     # =========================================================================
     # Sheet 10: Layout Features
     # =========================================================================
-    ws10 = wb.create_sheet("Layout Features")
-    ws10.sheet_properties.tabColor = "66CCFF"
+    ws10 = new_sheet(wb, "Layout Features", "66CCFF")
 
     # Frozen panes
     ws10.freeze_panes = 'B2'
 
-    ws10['A1'] = "Layout Features (Frozen B2)"
-    ws10['A1'].font = Font(bold=True, size=14, color="000000")
-
-    # Merged cells
-    ws10['A3'] = "Merged 3x1"
-    ws10['A3'].font = Font(bold=True, color="FFFFFF")
-    ws10['A3'].fill = PatternFill(start_color="4472C4", fill_type="solid")
-    ws10['A3'].alignment = Alignment(horizontal='center')
-    ws10.merge_cells('A3:C3')
-
-    ws10['A5'] = "Merged 1x3"
-    ws10['A5'].font = Font(bold=True, color="FFFFFF")
-    ws10['A5'].fill = PatternFill(start_color="70AD47", fill_type="solid")
-    ws10['A5'].alignment = Alignment(horizontal='center', vertical='center')
-    ws10.merge_cells('A5:A7')
-
-    ws10['E5'] = "Merged 2x2"
-    ws10['E5'].font = Font(bold=True, color="FFFFFF")
-    ws10['E5'].fill = PatternFill(start_color="ED7D31", fill_type="solid")
-    ws10['E5'].alignment = Alignment(horizontal='center', vertical='center')
-    ws10.merge_cells('E5:F6')
-
-    # Custom column widths
-    ws10['A10'] = "Column widths:"
-    ws10['A10'].font = Font(bold=True, color="000000")
-
+    # Custom column widths, and a hidden column G
     ws10.column_dimensions['A'].width = 20
     ws10.column_dimensions['B'].width = 5  # Narrow
     ws10.column_dimensions['C'].width = 30  # Wide
     ws10.column_dimensions['D'].width = 10
     ws10.column_dimensions['E'].width = 15
     ws10.column_dimensions['F'].width = 15
+    ws10.column_dimensions['G'].hidden = True
 
-    ws10['A11'] = "Width 20"
-    ws10['A11'].font = black_font
-    ws10['B11'] = "5"
-    ws10['B11'].font = black_font
-    ws10['C11'] = "Width 30 (wide column)"
-    ws10['C11'].font = black_font
-
-    # Custom row heights
-    ws10['A13'] = "Row heights:"
-    ws10['A13'].font = Font(bold=True, color="000000")
-
-    ws10['A14'] = "Height 30"
-    ws10['A14'].font = black_font
+    # Custom row heights, and a hidden row 19
     ws10.row_dimensions[14].height = 30
-
-    ws10['A15'] = "Height 50"
-    ws10['A15'].font = black_font
     ws10.row_dimensions[15].height = 50
-
-    ws10['A16'] = "Height 10 (short)"
-    ws10['A16'].font = black_font
     ws10.row_dimensions[16].height = 10
-
-    # Hidden row and column
-    ws10['A18'] = "Hidden row below (19)"
-    ws10['A18'].font = black_font
-    ws10['A19'] = "This row is hidden"
-    ws10['A19'].font = black_font
     ws10.row_dimensions[19].hidden = True
 
-    ws10['G1'] = "Hidden"
-    ws10['G1'].font = black_font
-    ws10.column_dimensions['G'].hidden = True
+    ws10.append([
+        make_cell(ws10, "Layout Features (Frozen B2)", font=TITLE_FONT),
+        None, None, None, None, None,
+        make_cell(ws10, "Hidden", font=BLACK_FONT),
+    ])
+    ws10.append([])
+
+    # Merged cells
+    ws10.append([make_cell(
+        ws10, "Merged 3x1",
+        font=WHITE_BOLD,
+        fill=BLUE_FILL,
+        alignment=Alignment(horizontal='center'),
+    )])
+    ws10.merged_cells.add('A3:C3')
+    ws10.append([])
+
+    ws10.append([
+        make_cell(
+            ws10, "Merged 1x3",
+            font=WHITE_BOLD,
+            fill=PatternFill(start_color="70AD47", fill_type="solid"),
+            alignment=Alignment(horizontal='center', vertical='center'),
+        ),
+        None, None, None,
+        make_cell(
+            ws10, "Merged 2x2",
+            font=WHITE_BOLD,
+            fill=PatternFill(start_color="ED7D31", fill_type="solid"),
+            alignment=Alignment(horizontal='center', vertical='center'),
+        ),
+    ])
+    ws10.merged_cells.add('A5:A7')
+    ws10.merged_cells.add('E5:F6')
+    for _ in range(6, 10):
+        ws10.append([])
+
+    # Column widths
+    ws10.append(header_row(ws10, ["Column widths:"]))
+    ws10.append(styled_row(ws10, ["Width 20", "5", "Width 30 (wide column)"], font=BLACK_FONT))
+    ws10.append([])
+
+    # Row heights
+    ws10.append(header_row(ws10, ["Row heights:"]))
+    ws10.append([make_cell(ws10, "Height 30", font=BLACK_FONT)])
+    ws10.append([make_cell(ws10, "Height 50", font=BLACK_FONT)])
+    ws10.append([make_cell(ws10, "Height 10 (short)", font=BLACK_FONT)])
+    ws10.append([])
+
+    # Hidden row
+    ws10.append([make_cell(ws10, "Hidden row below (19)", font=BLACK_FONT)])
+    ws10.append([make_cell(ws10, "This row is hidden", font=BLACK_FONT)])
 
     # =========================================================================
     # Sheet 11: Images
     # =========================================================================
-    ws11 = wb.create_sheet("Images")
-    ws11.sheet_properties.tabColor = "FF99CC"
+    ws11 = new_sheet(wb, "Images", "FF99CC")
 
-    ws11['A1'] = "Embedded Images"
-    ws11['A1'].font = Font(bold=True, size=14, color="000000")
+    ws11.append([make_cell(ws11, "Embedded Images", font=TITLE_FONT)])
 
     # Add test images
     colors_imgs = [
@@ -903,28 +858,34 @@ def create_kitchen_sink_v3():
         ((0, 255, 255), "D8", "Cyan"),
     ]
 
+    # Encode every swatch up front; each Image still gets its own stream
+    pngs = {color: create_test_png(color, (60, 60)) for color, _, _ in colors_imgs}
+
+    # Labels go in row 2 above each image's column; an image further down
+    # the same column replaces the label of the one above it.
+    labels = [None] * 8
     for color, anchor, name in colors_imgs:
-        img = Image(create_test_image(color, (60, 60)))
+        img = Image(io.BytesIO(pngs[color]))
         img.anchor = anchor
         ws11.add_image(img)
         # Add label
-        col = anchor[0]
-        ws11[f'{col}2'] = name
-        ws11[f'{col}2'].font = black_font
+        col = column_index_from_string(anchor[0])
+        labels[col - 1] = make_cell(ws11, name, font=BLACK_FONT)
+    ws11.append(labels)
 
     # =========================================================================
     # Sheet 12: Edge Cases
     # =========================================================================
-    ws12 = wb.create_sheet("Edge Cases")
-    ws12.sheet_properties.tabColor = "808080"
+    ws12 = new_sheet(wb, "Edge Cases", "808080")
+    ws12.column_dimensions['A'].width = 20
+    ws12.column_dimensions['B'].width = 40
 
-    ws12['A1'] = "Edge Cases for Testing"
-    ws12['A1'].font = Font(bold=True, size=14, color="000000")
-    ws12.merge_cells('A1:C1')
+    ws12.append([make_cell(ws12, "Edge Cases for Testing", font=TITLE_FONT)])
+    ws12.merged_cells.add('A1:C1')
+    ws12.append([])
 
     # Unicode
-    ws12['A3'] = "Unicode:"
-    ws12['A3'].font = Font(bold=True, color="000000")
+    ws12.append(header_row(ws12, ["Unicode:"]))
 
     unicode_tests = [
         ("Chinese", "Hello World"),
@@ -936,56 +897,41 @@ def create_kitchen_sink_v3():
         ("Math symbols", "Test"),
     ]
 
-    for i, (name, text) in enumerate(unicode_tests, 4):
-        ws12[f'A{i}'] = name
-        ws12[f'A{i}'].font = black_font
-        ws12[f'B{i}'] = text
-        ws12[f'B{i}'].font = black_font
+    for name, text in unicode_tests:
+        ws12.append(styled_row(ws12, [name, text], font=BLACK_FONT))
+    ws12.append([])
 
     # Very long string
-    ws12['A12'] = "Long string:"
-    ws12['A12'].font = Font(bold=True, color="000000")
-    ws12['B12'] = "A" * 1000  # 1000 character string
-    ws12['B12'].font = black_font
-
-    # Empty cells with formatting
-    ws12['A14'] = "Empty with style:"
-    ws12['A14'].font = Font(bold=True, color="000000")
-    ws12['B14'].fill = PatternFill(start_color="FFFF00", fill_type="solid")
-    ws12['C14'].border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    ws12.append([
+        make_cell(ws12, "Long string:", font=HEADER_BOLD),
+        make_cell(ws12, "A" * 1000, font=BLACK_FONT),  # 1000 character string
+    ])
+    ws12.append([])
+
+    # Empty cells with formatting; write-only sheets emit exactly the cells
+    # appended, so these valueless cells exist only because they are styled
+    ws12.append([
+        make_cell(ws12, "Empty with style:", font=HEADER_BOLD),
+        make_cell(ws12, None, fill=YELLOW_FILL),
+        make_cell(ws12, None, border=_box_border('thin', None)),
+    ])
+    ws12.append([])
 
     # Numbers at limits
-    ws12['A16'] = "Number limits:"
-    ws12['A16'].font = Font(bold=True, color="000000")
-
-    ws12['A17'] = "Very small"
-    ws12['A17'].font = black_font
-    ws12['B17'] = 0.000000001
-    ws12['B17'].font = black_font
-
-    ws12['A18'] = "Very large"
-    ws12['A18'].font = black_font
-    ws12['B18'] = 999999999999.99
-    ws12['B18'].font = black_font
-
-    ws12['A19'] = "Negative"
-    ws12['A19'].font = black_font
-    ws12['B19'] = -12345.67
-    ws12['B19'].font = black_font
+    ws12.append(header_row(ws12, ["Number limits:"]))
 
-    ws12['A20'] = "Zero"
-    ws12['A20'].font = black_font
-    ws12['B20'] = 0
-    ws12['B20'].font = black_font
+    limits = [
+        ("Very small", 0.000000001),
+        ("Very large", 999999999999.99),
+        ("Negative", -12345.67),
+        ("Zero", 0),
+    ]
+    for name, value in limits:
+        ws12.append(styled_row(ws12, [name, value], font=BLACK_FONT))
+    ws12.append([])
 
     # Special characters in text
-    ws12['A22'] = "Special chars:"
-    ws12['A22'].font = Font(bold=True, color="000000")
+    ws12.append(header_row(ws12, ["Special chars:"]))
 
     special_chars = [
         ("Quotes", 'Text with "quotes" inside'),
@@ -996,29 +942,21 @@ def create_kitchen_sink_v3():
         ("Tab", "Col1\tCol2"),
     ]
 
-    for i, (name, text) in enumerate(special_chars, 23):
-        ws12[f'A{i}'] = name
-        ws12[f'A{i}'].font = black_font
-        ws12[f'B{i}'] = text
-        ws12[f'B{i}'].font = black_font
-
-    ws12.column_dimensions['A'].width = 20
-    ws12.column_dimensions['B'].width = 40
+    for name, text in special_chars:
+        ws12.append(styled_row(ws12, [name, text], font=BLACK_FONT))
 
     # =========================================================================
     # Sheet 13: Empty Sheet (for edge case testing)
     # =========================================================================
-    ws13 = wb.create_sheet("Empty Sheet")
-    ws13.sheet_properties.tabColor = "CCCCCC"
+    ws13 = new_sheet(wb, "Empty Sheet", "CCCCCC")
     # Intentionally empty
 
     # =========================================================================
     # Sheet 14: Hidden Sheet
     # =========================================================================
-    ws14 = wb.create_sheet("Hidden Sheet")
+    ws14 = new_sheet(wb, "Hidden Sheet")
     ws14.sheet_state = 'hidden'
-    ws14['A1'] = "This sheet is hidden"
-    ws14['A1'].font = black_font
+    ws14.append([make_cell(ws14, "This sheet is hidden", font=BLACK_FONT)])
 
     # =========================================================================
     # Add named ranges
@@ -1038,7 +976,7 @@ def create_kitchen_sink_v3():
     # Save
     # =========================================================================
     output_path = "/Users/robby/projects/xlview/test/kitchen_sink_v3.xlsx"
-    wb.save(output_path)
+    save_workbook(wb, output_path)
     print(f"Created: {output_path}")
 
     # Summary
@@ -16,9 +16,14 @@ Usage:
 """
 
 import argparse
+import io
 import json
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import (
     Font, Fill, PatternFill, GradientFill, Border, Side,
     Alignment, Protection, NamedStyle
@@ -31,315 +36,404 @@ import random
 
 OUTPUT_DIR = Path(__file__).parent.parent / "test"
 
+# Shared styles, reused by reference instead of rebuilt per cell
+TITLE_FONT = Font(size=16, bold=True)
+MEDIUM_BLACK = Side(style="medium", color="000000")
+MEDIUM_RED = Side(style="medium", color="FF0000")
+
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+ALT_FILL = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+BOLD_FONT = Font(bold=True)
+
+# Large-file row styles (font, fill), keyed by (zebra row, bold row)
+ROW_STYLES = {
+    (False, False): (None, None),
+    (True, False): (None, ALT_FILL),
+    (False, True): (BOLD_FONT, None),
+    (True, True): (BOLD_FONT, ALT_FILL),
+}
+
+# Sample data, built once at import rather than on every call
+FONT_FACES = (
+    ("Calibri", 11), ("Arial", 12), ("Times New Roman", 11),
+    ("Verdana", 10), ("Courier New", 11), ("Georgia", 11),
+)
+FONT_COLORS = (
+    ("FF0000", "Red"), ("00FF00", "Green"), ("0000FF", "Blue"),
+    ("FF00FF", "Magenta"), ("00FFFF", "Cyan"), ("FFA500", "Orange"),
+)
+FILL_COLORS = ("FFFF00", "90EE90", "ADD8E6", "FFB6C1", "DDA0DD", "F0E68C")
+FILL_PATTERNS = ("gray125", "gray0625", "darkGray", "mediumGray", "lightGray", "darkHorizontal")
+BORDER_STYLES = ("thin", "medium", "thick", "double", "dotted", "dashed")
+H_ALIGNS = ("left", "center", "right", "justify")
+V_ALIGNS = ("top", "center", "bottom")
+NUMBER_FORMATS = (
+    (1234.567, "General", "General"),
+    (1234.567, "#,##0.00", "Thousands"),
+    (0.4567, "0.00%", "Percent"),
+    (1234.56, "$#,##0.00", "Currency"),
+    (1234.56, '"$"#,##0.00_);[Red]("$"#,##0.00)', "Accounting"),
+    (0.5, "# ?/?", "Fraction"),
+    (1234567, "0.00E+00", "Scientific"),
+    (date(2024, 3, 15), "YYYY-MM-DD", "Date ISO"),
+    (date(2024, 3, 15), "MM/DD/YYYY", "Date US"),
+    (date(2024, 3, 15), "DD-MMM-YYYY", "Date Long"),
+    (datetime(2024, 3, 15, 14, 30, 0), "HH:MM:SS", "Time"),
+    (datetime(2024, 3, 15, 14, 30, 0), "YYYY-MM-DD HH:MM", "DateTime"),
+)
+RAINBOW = ("FF0000", "FF7F00", "FFFF00", "00FF00", "0000FF", "4B0082", "9400D3")
+THEME_COLORS = (
+    ("FFFFFF", "000000", "E7E6E6", "44546A", "4472C4", "ED7D31"),
+    ("D0CECE", "7F7F7F", "AEAAAA", "8497B0", "8FAADC", "F4B183"),
+    ("A5A5A5", "595959", "757171", "ACB9CA", "B4C6E7", "F8CBAD"),
+)
+
+FMT_NUM = "#,##0.00"
+FMT_PCT = "0.00%"
+FMT_DATE = "YYYY-MM-DD"
+EXCEL_EPOCH = date(1899, 12, 30)
+
+
+def make_cell(ws, value, **attrs):
+    """Create a WriteOnlyCell with the given style/comment/hyperlink attributes."""
+    cell = WriteOnlyCell(ws, value=value)
+    for name, attr in attrs.items():
+        setattr(cell, name, attr)
+    return cell
+
+
+def add_title(ws, text, merge_range):
+    """Append a sheet title row and merge it across ``merge_range``."""
+    # Only the top-left cell of a merge is kept, so that is the one styled
+    ws.append([make_cell(ws, text, font=TITLE_FONT)])
+    ws.merged_cells.add(merge_range)
+
+
+def save_workbook(wb, path, compresslevel=1):
+    """Save ``wb`` to ``path`` with its parts deflated at ``compresslevel``.
+
+    openpyxl's writer always uses zlib's default level 6; for a local
+    fixture level 1 is much faster for a slightly larger file. The package is
+    re-packed in memory, written to a temporary file in one write() and
+    moved over ``path``, so a failed run never leaves a partial workbook.
+    """
+    buf = io.BytesIO()
+    wb.save(buf)
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(buf) as src, \
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            dst.writestr(info, src.read(info), zipfile.ZIP_DEFLATED, compresslevel)
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(out.getbuffer())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
 
 def create_kitchen_sink():
-    """Create a comprehensive test file with all formatting features."""
-    wb = Workbook()
+    """Create a comprehensive test file with all formatting features.
+
+    The workbook is write-only, so each sheet's tab color, frozen panes and
+    column/row dimensions are set before its rows are appended in order.
+    """
+    wb = Workbook(write_only=True)
 
     # === Sheet 1: Fonts & Colors ===
-    ws = wb.active
-    ws.title = "Fonts & Colors"
+    ws = wb.create_sheet("Fonts & Colors")
     ws.sheet_properties.tabColor = "FF6B6B"
+    ws.column_dimensions["A"].width = 20
+    ws.column_dimensions["C"].width = 18
+    ws.column_dimensions["E"].width = 12
 
     # Header
-    ws["A1"] = "Font & Color Tests"
-    ws["A1"].font = Font(size=16, bold=True)
-    ws.merge_cells("A1:E1")
-
-    # Different fonts
-    fonts = [
-        ("Calibri", 11), ("Arial", 12), ("Times New Roman", 11),
-        ("Verdana", 10), ("Courier New", 11), ("Georgia", 11)
+    add_title(ws, "Font & Color Tests", "A1:E1")
+    ws.append([])
+
+    # Different fonts (A), font styles (C) and font colors (E)
+    font_styles = [
+        ("Bold", BOLD_FONT),
+        ("Italic", Font(italic=True)),
+        ("Underline", Font(underline="single")),
+        ("Double Underline", Font(underline="double")),
+        ("Strikethrough", Font(strike=True)),
+        ("Bold Italic", Font(bold=True, italic=True)),
     ]
-    for i, (name, size) in enumerate(fonts, start=3):
-        ws.cell(row=i, column=1, value=f"{name} {size}pt")
-        ws.cell(row=i, column=1).font = Font(name=name, size=size)
-
-    # Font styles
-    ws["C3"] = "Bold"
-    ws["C3"].font = Font(bold=True)
-    ws["C4"] = "Italic"
-    ws["C4"].font = Font(italic=True)
-    ws["C5"] = "Underline"
-    ws["C5"].font = Font(underline="single")
-    ws["C6"] = "Double Underline"
-    ws["C6"].font = Font(underline="double")
-    ws["C7"] = "Strikethrough"
-    ws["C7"].font = Font(strike=True)
-    ws["C8"] = "Bold Italic"
-    ws["C8"].font = Font(bold=True, italic=True)
-
-    # Font colors
-    colors = [
-        ("FF0000", "Red"), ("00FF00", "Green"), ("0000FF", "Blue"),
-        ("FF00FF", "Magenta"), ("00FFFF", "Cyan"), ("FFA500", "Orange")
-    ]
-    for i, (color, name) in enumerate(colors, start=3):
-        ws.cell(row=i, column=5, value=name)
-        ws.cell(row=i, column=5).font = Font(color=color)
+    for (name, size), (label, font), (color, color_name) in zip(FONT_FACES, font_styles, FONT_COLORS):
+        ws.append([
+            make_cell(ws, f"{name} {size}pt", font=Font(name=name, size=size)),
+            None,
+            make_cell(ws, label, font=font),
+            None,
+            make_cell(ws, color_name, font=Font(color=color)),
+        ])
+    ws.append([])
+    ws.append([])
 
     # Background fills
-    ws["A11"] = "Background Fills:"
-    ws["A11"].font = Font(bold=True)
-    fill_colors = ["FFFF00", "90EE90", "ADD8E6", "FFB6C1", "DDA0DD", "F0E68C"]
-    for i, color in enumerate(fill_colors):
-        cell = ws.cell(row=12, column=i+1, value=f"Fill {i+1}")
-        cell.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
+    ws.append([make_cell(ws, "Background Fills:", font=BOLD_FONT)])
+    ws.append([
+        make_cell(ws, f"Fill {i+1}", fill=PatternFill(start_color=color, end_color=color, fill_type="solid"))
+        for i, color in enumerate(FILL_COLORS)
+    ])
+    ws.append([])
 
     # Pattern fills
-    ws["A14"] = "Pattern Fills:"
-    ws["A14"].font = Font(bold=True)
-    patterns = ["gray125", "gray0625", "darkGray", "mediumGray", "lightGray", "darkHorizontal"]
-    for i, pattern in enumerate(patterns):
-        cell = ws.cell(row=15, column=i+1, value=pattern[:8])
-        cell.fill = PatternFill(start_color="000000", end_color="FFFFFF", fill_type=pattern)
-
-    ws.column_dimensions["A"].width = 20
-    ws.column_dimensions["C"].width = 18
-    ws.column_dimensions["E"].width = 12
+    ws.append([make_cell(ws, "Pattern Fills:", font=BOLD_FONT)])
+    ws.append([
+        make_cell(ws, pattern[:8], fill=PatternFill(start_color="000000", end_color="FFFFFF", fill_type=pattern))
+        for pattern in FILL_PATTERNS
+    ])
 
     # === Sheet 2: Borders ===
     ws2 = wb.create_sheet("Borders")
     ws2.sheet_properties.tabColor = "4ECDC4"
+    ws2.column_dimensions["B"].width = 15
+    ws2.column_dimensions["D"].width = 15
 
-    ws2["A1"] = "Border Tests"
-    ws2["A1"].font = Font(size=16, bold=True)
-    ws2.merge_cells("A1:E1")
+    add_title(ws2, "Border Tests", "A1:E1")
+    ws2.append([])
 
-    # Border styles
-    border_styles = ["thin", "medium", "thick", "double", "dotted", "dashed"]
-    for i, style in enumerate(border_styles, start=3):
-        cell = ws2.cell(row=i, column=2, value=style)
+    # Border styles (B) alongside colored and partial borders (D), by row
+    border_cells = []
+    for style in BORDER_STYLES:
         side = Side(style=style, color="000000")
-        cell.border = Border(left=side, right=side, top=side, bottom=side)
-
-    # Colored borders
-    ws2["D3"] = "Red Border"
-    ws2["D3"].border = Border(
-        left=Side(style="medium", color="FF0000"),
-        right=Side(style="medium", color="FF0000"),
-        top=Side(style="medium", color="FF0000"),
-        bottom=Side(style="medium", color="FF0000")
-    )
-
-    ws2["D5"] = "Mixed"
-    ws2["D5"].border = Border(
-        left=Side(style="thick", color="FF0000"),
-        right=Side(style="thick", color="00FF00"),
-        top=Side(style="thick", color="0000FF"),
-        bottom=Side(style="thick", color="FF00FF")
-    )
-
-    # Partial borders
-    ws2["D7"] = "Top only"
-    ws2["D7"].border = Border(top=Side(style="medium", color="000000"))
-    ws2["D8"] = "Bottom only"
-    ws2["D8"].border = Border(bottom=Side(style="medium", color="000000"))
-    ws2["D9"] = "Left+Right"
-    ws2["D9"].border = Border(
-        left=Side(style="medium", color="000000"),
-        right=Side(style="medium", color="000000")
-    )
-
-    ws2.column_dimensions["B"].width = 15
-    ws2.column_dimensions["D"].width = 15
+        border_cells.append(make_cell(ws2, style, border=Border(left=side, right=side, top=side, bottom=side)))
+
+    d_cells = {
+        # Colored borders
+        3: make_cell(ws2, "Red Border",
+                     border=Border(left=MEDIUM_RED, right=MEDIUM_RED, top=MEDIUM_RED, bottom=MEDIUM_RED)),
+        5: make_cell(ws2, "Mixed", border=Border(
+            left=Side(style="thick", color="FF0000"),
+            right=Side(style="thick", color="00FF00"),
+            top=Side(style="thick", color="0000FF"),
+            bottom=Side(style="thick", color="FF00FF")
+        )),
+        # Partial borders
+        7: make_cell(ws2, "Top only", border=Border(top=MEDIUM_BLACK)),
+        8: make_cell(ws2, "Bottom only", border=Border(bottom=MEDIUM_BLACK)),
+        9: make_cell(ws2, "Left+Right", border=Border(left=MEDIUM_BLACK, right=MEDIUM_BLACK)),
+    }
+    for r in range(3, 10):
+        b_cell = border_cells[r - 3] if r - 3 < len(border_cells) else None
+        ws2.append([None, b_cell, None, d_cells.get(r)])
 
     # === Sheet 3: Alignment & Sizing ===
     ws3 = wb.create_sheet("Alignment")
     ws3.sheet_properties.tabColor = "45B7D1"
 
-    ws3["A1"] = "Alignment & Sizing"
-    ws3["A1"].font = Font(size=16, bold=True)
-    ws3.merge_cells("A1:E1")
-
-    # Horizontal alignment
-    h_aligns = ["left", "center", "right", "justify"]
-    for i, align in enumerate(h_aligns):
-        cell = ws3.cell(row=3, column=i+1, value=f"H: {align}")
-        cell.alignment = Alignment(horizontal=align)
+    # Different column widths
+    for letter, width in zip("ABCD", [8, 15, 25, 35]):
+        ws3.column_dimensions[letter].width = width
 
-    # Vertical alignment
-    v_aligns = ["top", "center", "bottom"]
+    # Row heights are picked up as each row is appended
     ws3.row_dimensions[5].height = 40
-    for i, align in enumerate(v_aligns):
-        cell = ws3.cell(row=5, column=i+1, value=f"V: {align}")
-        cell.alignment = Alignment(vertical=align)
-
-    # Text wrap
-    ws3["A7"] = "This is a long text that should wrap to multiple lines in the cell"
-    ws3["A7"].alignment = Alignment(wrap_text=True)
-    ws3.column_dimensions["A"].width = 20
     ws3.row_dimensions[7].height = 45
+    for i, height in enumerate([15, 25, 35, 45], start=14):
+        ws3.row_dimensions[i].height = height
+
+    add_title(ws3, "Alignment & Sizing", "A1:E1")
+    ws3.append([])
 
-    # Rotated text
-    ws3["C7"] = "45 degrees"
-    ws3["C7"].alignment = Alignment(text_rotation=45)
-    ws3["D7"] = "90 degrees"
-    ws3["D7"].alignment = Alignment(text_rotation=90)
-    ws3["E7"] = "-45 degrees"
-    ws3["E7"].alignment = Alignment(text_rotation=135)
+    # Horizontal alignment
+    ws3.append([make_cell(ws3, f"H: {align}", alignment=Alignment(horizontal=align)) for align in H_ALIGNS])
+    ws3.append([])
+
+    # Vertical alignment
+    ws3.append([make_cell(ws3, f"V: {align}", alignment=Alignment(vertical=align)) for align in V_ALIGNS])
+    ws3.append([])
+
+    # Text wrap and rotated text
+    ws3.append([
+        make_cell(ws3, "This is a long text that should wrap to multiple lines in the cell",
+                  alignment=Alignment(wrap_text=True)),
+        None,
+        make_cell(ws3, "45 degrees", alignment=Alignment(text_rotation=45)),
+        make_cell(ws3, "90 degrees", alignment=Alignment(text_rotation=90)),
+        make_cell(ws3, "-45 degrees", alignment=Alignment(text_rotation=135)),
+    ])
+    ws3.append([])
+    ws3.append([])
 
     # Merged cells
-    ws3["A10"] = "This is a merged cell region"
-    ws3["A10"].alignment = Alignment(horizontal="center", vertical="center")
-    ws3.merge_cells("A10:C12")
-    ws3["A10"].fill = PatternFill(start_color="E8E8E8", end_color="E8E8E8", fill_type="solid")
+    ws3.append([make_cell(
+        ws3, "This is a merged cell region",
+        alignment=Alignment(horizontal="center", vertical="center"),
+        fill=PatternFill(start_color="E8E8E8", end_color="E8E8E8", fill_type="solid"),
+    )])
+    ws3.merged_cells.add("A10:C12")
+    for _ in range(3):
+        ws3.append([])
 
     # Different row heights
-    for i, height in enumerate([15, 25, 35, 45], start=14):
-        ws3.row_dimensions[i].height = height
-        ws3.cell(row=i, column=1, value=f"Height: {height}pt")
-
-    # Different column widths
-    for i, width in enumerate([8, 15, 25, 35], start=1):
-        ws3.column_dimensions[get_column_letter(i)].width = width
+    for height in [15, 25, 35, 45]:
+        ws3.append([f"Height: {height}pt"])
 
     # === Sheet 4: Numbers & Dates ===
     ws4 = wb.create_sheet("Numbers")
     ws4.sheet_properties.tabColor = "96CEB4"
+    ws4.column_dimensions["A"].width = 20
+    ws4.column_dimensions["B"].width = 15
+    ws4.column_dimensions["C"].width = 20
 
-    ws4["A1"] = "Number Formats"
-    ws4["A1"].font = Font(size=16, bold=True)
-    ws4.merge_cells("A1:D1")
+    add_title(ws4, "Number Formats", "A1:D1")
+    ws4.append([])
 
     # Various number formats
-    formats = [
-        (1234.567, "General", "General"),
-        (1234.567, "#,##0.00", "Thousands"),
-        (0.4567, "0.00%", "Percent"),
-        (1234.56, "$#,##0.00", "Currency"),
-        (1234.56, '"$"#,##0.00_);[Red]("$"#,##0.00)', "Accounting"),
-        (0.5, "# ?/?", "Fraction"),
-        (1234567, "0.00E+00", "Scientific"),
-        (date(2024, 3, 15), "YYYY-MM-DD", "Date ISO"),
-        (date(2024, 3, 15), "MM/DD/YYYY", "Date US"),
-        (date(2024, 3, 15), "DD-MMM-YYYY", "Date Long"),
-        (datetime(2024, 3, 15, 14, 30, 0), "HH:MM:SS", "Time"),
-        (datetime(2024, 3, 15, 14, 30, 0), "YYYY-MM-DD HH:MM", "DateTime"),
-    ]
+    ws4.append([make_cell(ws4, label, font=BOLD_FONT) for label in ("Value", "Format", "Result")])
 
-    ws4["A3"] = "Value"
-    ws4["B3"] = "Format"
-    ws4["C3"] = "Result"
-    ws4["A3"].font = ws4["B3"].font = ws4["C3"].font = Font(bold=True)
-
-    for i, (value, fmt, label) in enumerate(formats, start=4):
-        ws4.cell(row=i, column=1, value=str(value) if not isinstance(value, (date, datetime)) else value.isoformat())
-        ws4.cell(row=i, column=2, value=label)
-        cell = ws4.cell(row=i, column=3, value=value)
-        cell.number_format = fmt
+    for value, fmt, label in NUMBER_FORMATS:
+        ws4.append([
+            str(value) if not isinstance(value, (date, datetime)) else value.isoformat(),
+            label,
+            make_cell(ws4, value, number_format=fmt),
+        ])
+    ws4.append([])
+    ws4.append([])
 
     # Negative numbers
-    ws4["A18"] = "Negative Numbers:"
-    ws4["A18"].font = Font(bold=True)
-    ws4.cell(row=19, column=1, value=-1234.56).number_format = "#,##0.00"
-    ws4.cell(row=19, column=2, value=-1234.56).number_format = "#,##0.00;[Red]-#,##0.00"
-    ws4.cell(row=19, column=3, value=-1234.56).number_format = "#,##0.00_);(#,##0.00)"
-
-    ws4.column_dimensions["A"].width = 20
-    ws4.column_dimensions["B"].width = 15
-    ws4.column_dimensions["C"].width = 20
+    ws4.append([make_cell(ws4, "Negative Numbers:", font=BOLD_FONT)])
+    ws4.append([
+        make_cell(ws4, -1234.56, number_format="#,##0.00"),
+        make_cell(ws4, -1234.56, number_format="#,##0.00;[Red]-#,##0.00"),
+        make_cell(ws4, -1234.56, number_format="#,##0.00_);(#,##0.00)"),
+    ])
 
     # === Sheet 5: Special Features ===
     ws5 = wb.create_sheet("Special")
     ws5.sheet_properties.tabColor = "FFEAA7"
+    ws5.column_dimensions["A"].width = 30
+
+    # Frozen panes
+    ws5.freeze_panes = "A2"
 
-    ws5["A1"] = "Special Features"
-    ws5["A1"].font = Font(size=16, bold=True)
-    ws5.merge_cells("A1:D1")
+    add_title(ws5, "Special Features", "A1:D1")
+    ws5.append([])
 
     # Hyperlinks
-    ws5["A3"] = "Hyperlinks:"
-    ws5["A3"].font = Font(bold=True)
-    ws5["A4"] = "Click me!"
-    ws5["A4"].hyperlink = "https://example.com"
-    ws5["A4"].font = Font(color="0563C1", underline="single")
+    ws5.append([make_cell(ws5, "Hyperlinks:", font=BOLD_FONT)])
+    ws5.append([make_cell(ws5, "Click me!", hyperlink="https://example.com",
+                          font=Font(color="0563C1", underline="single"))])
+    ws5.append([])
 
     # Comments
-    ws5["A6"] = "Comments:"
-    ws5["A6"].font = Font(bold=True)
-    ws5["A7"] = "Hover over me"
-    ws5["A7"].comment = Comment("This is a comment!\nWith multiple lines.", "Test Author")
+    ws5.append([make_cell(ws5, "Comments:", font=BOLD_FONT)])
+    ws5.append([make_cell(ws5, "Hover over me",
+                          comment=Comment("This is a comment!\nWith multiple lines.", "Test Author"))])
+    ws5.append([])
 
-    # Frozen panes
-    ws5["A9"] = "This sheet has frozen panes (row 1)"
-    ws5.freeze_panes = "A2"
+    ws5.append(["This sheet has frozen panes (row 1)"])
+    ws5.append([])
 
     # Rich text (using multiple cells to simulate)
-    ws5["A11"] = "Rich Text (simulated with formatting):"
-    ws5["A11"].font = Font(bold=True)
-
-    ws5.column_dimensions["A"].width = 30
+    ws5.append([make_cell(ws5, "Rich Text (simulated with formatting):", font=BOLD_FONT)])
 
     # === Sheet 6: Hidden Sheet (for testing visibility) ===
     ws6 = wb.create_sheet("Hidden Sheet")
-    ws6["A1"] = "This sheet is hidden"
+    ws6.append(["This sheet is hidden"])
     ws6.sheet_state = "hidden"
 
     # Save
     OUTPUT_DIR.mkdir(exist_ok=True)
     output_path = OUTPUT_DIR / "kitchen_sink.xlsx"
-    wb.save(output_path)
+    save_workbook(wb, output_path)
     print(f"Created: {output_path}")
     return output_path
 
 
-def create_large_file(rows=5000, cols=20):
-    """Create a large file for load testing."""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Large Dataset"
+def create_large_file(rows=5000, cols=20, seed=0):
+    """Create a large file for load testing.
+
+    Uses a write-only workbook so rows stream to disk instead of being held
+    as Cell objects, which keeps memory flat for large row counts. openpyxl
+    already serializes each appended row through xmlfile; hand-writing the
+    sheet XML would also mean hand-building styles.xml for every fill, font
+    and number format combination used here.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Large Dataset")
+
+    # Write-only sheets need the frozen header and column widths up front
+    ws.freeze_panes = "A2"
+    letters = [get_column_letter(c) for c in range(1, cols + 1)]
+    for letter in letters:
+        ws.column_dimensions[letter].width = 12
 
     # Header row
+    header = []
     for c in range(1, cols + 1):
-        cell = ws.cell(row=1, column=c, value=f"Column {c}")
-        cell.font = Font(bold=True)
-        cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        cell.font = Font(bold=True, color="FFFFFF")
+        cell = WriteOnlyCell(ws, value=f"Column {c}")
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        header.append(cell)
+    ws.append(header)
+
+    # Fixed seed so regenerating the fixture gives the same workbook
+    rng = random.Random(seed)
+    # Bound methods, looked up once for the per-cell generators below
+    uniform, randint = rng.uniform, rng.randint
+
+    # Dates go in as Excel serial days, which FMT_DATE renders; a table of
+    # month starts for 2020-2024 saves building a date object per cell
+    month_starts = [(date(2020 + y, m, 1) - EXCEL_EPOCH).days for y in range(5) for m in range(1, 13)]
+
+    def random_date():
+        return month_starts[12 * randint(0, 4) + randint(1, 12) - 1] + randint(1, 28) - 1
+
+    # Resolve each column's generator and number format once, not per cell
+    generators = []
+    formats = [None, None][:cols]
+    for c in range(3, cols + 1):
+        if c % 3 == 0:
+            generators.append(lambda: uniform(0, 10000))
+            formats.append(FMT_NUM)
+        elif c % 3 == 1:
+            generators.append(lambda: uniform(0, 1))
+            formats.append(FMT_PCT)
+        else:
+            generators.append(random_date)
+            formats.append(FMT_DATE)
 
     # Data rows with mixed formatting
-    colors = ["FFFF00", "90EE90", "ADD8E6", "FFB6C1", "FFFFFF"]
-
     for r in range(2, rows + 2):
-        for c in range(1, cols + 1):
-            cell = ws.cell(row=r, column=c)
-
-            # Vary the content type
-            if c == 1:
-                cell.value = r - 1  # Row number
-            elif c == 2:
-                cell.value = f"Row {r-1}"
-            elif c % 3 == 0:
-                cell.value = random.uniform(0, 10000)
-                cell.number_format = "#,##0.00"
-            elif c % 3 == 1:
-                cell.value = random.uniform(0, 1)
-                cell.number_format = "0.00%"
-            else:
-                cell.value = date(2020 + random.randint(0, 4), random.randint(1, 12), random.randint(1, 28))
-                cell.number_format = "YYYY-MM-DD"
-
-            # Add some formatting variety
-            if r % 2 == 0:
-                cell.fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-
-            if r % 10 == 0:
-                cell.font = Font(bold=True)
+        # Add some formatting variety, looked up once per row
+        font, fill = ROW_STYLES[r % 2 == 0, r % 10 == 0]
+        plain = font is None and fill is None
+
+        values = [r - 1, f"Row {r-1}"][:cols] + [gen() for gen in generators]
+        row = []
+        for value, fmt in zip(values, formats):
+            # Unformatted values in unstyled rows go in bare
+            if fmt is None and plain:
+                row.append(value)
+                continue
+
+            cell = WriteOnlyCell(ws, value=value)
+            if fmt:
+                cell.number_format = fmt
+            if fill:
+                cell.fill = fill
+            if font:
+                cell.font = font
+
+            row.append(cell)
+        ws.append(row)
 
         # Progress indicator
         if r % 1000 == 0:
             print(f"  Generated {r}/{rows} rows...")
 
-    # Freeze header row
-    ws.freeze_panes = "A2"
-
-    # Set column widths
-    for c in range(1, cols + 1):
-        ws.column_dimensions[get_column_letter(c)].width = 12
-
     OUTPUT_DIR.mkdir(exist_ok=True)
     output_path = OUTPUT_DIR / f"large_{rows}x{cols}.xlsx"
-    wb.save(output_path)
+    save_workbook(wb, output_path)
     print(f"Created: {output_path}")
     return output_path
 
@@ -351,11 +445,7 @@ def create_colors_only():
     ws.title = "Colors"
 
     # Rainbow gradient
-    rainbow = [
-        "FF0000", "FF7F00", "FFFF00", "00FF00",
-        "0000FF", "4B0082", "9400D3"
-    ]
-    for i, color in enumerate(rainbow):
+    for i, color in enumerate(RAINBOW):
         for j in range(5):
             cell = ws.cell(row=j+1, column=i+1)
             cell.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
@@ -370,13 +460,7 @@ def create_colors_only():
             cell.font = Font(color="FFFFFF")
 
     # Theme-like colors (simulating Excel themes)
-    theme_colors = [
-        ["FFFFFF", "000000", "E7E6E6", "44546A", "4472C4", "ED7D31"],
-        ["D0CECE", "7F7F7F", "AEAAAA", "8497B0", "8FAADC", "F4B183"],
-        ["A5A5A5", "595959", "757171", "ACB9CA", "B4C6E7", "F8CBAD"],
-    ]
-
-    for r, row_colors in enumerate(theme_colors, start=9):
+    for r, row_colors in enumerate(THEME_COLORS, start=9):
         for c, color in enumerate(row_colors, start=1):
             cell = ws.cell(row=r, column=c)
             cell.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
@@ -385,19 +469,21 @@ def create_colors_only():
             cell.font = Font(color="000000" if luminance > 128 else "FFFFFF")
             cell.value = f"#{color}"
 
-    for c in range(1, 11):
-        ws.column_dimensions[get_column_letter(c)].width = 10
+    for letter in "ABCDEFGHIJ":
+        ws.column_dimensions[letter].width = 10
 
     OUTPUT_DIR.mkdir(exist_ok=True)
     output_path = OUTPUT_DIR / "colors_test.xlsx"
-    wb.save(output_path)
+    save_workbook(wb, output_path)
     print(f"Created: {output_path}")
     return output_path
 
 
 def update_manifest():
     """Update manifest.json with all xlsx files in test directory."""
-    xlsx_files = sorted(OUTPUT_DIR.glob("*.xlsx"))
+    # scandir hands back the stat result with each entry, so no extra lookups
+    with os.scandir(OUTPUT_DIR) as it:
+        xlsx_files = sorted((e for e in it if e.name.endswith(".xlsx")), key=lambda e: e.name)
 
     manifest = []
     for f in xlsx_files:
@@ -446,10 +532,16 @@ def main():
     elif args.only == "colors":
         create_colors_only()
     else:
-        # Generate all
-        create_kitchen_sink()
-        create_colors_only()
-        create_large_file(args.rows, args.cols)
+        # Generate all; the files are independent, so build them side by side
+        OUTPUT_DIR.mkdir(exist_ok=True)
+        with ProcessPoolExecutor(max_workers=3) as ex:
+            futures = [
+                ex.submit(create_kitchen_sink),
+                ex.submit(create_colors_only),
+                ex.submit(create_large_file, args.rows, args.cols),
+            ]
+            for future in futures:
+                future.result()
 
     # Always update manifest after generating files
     update_manifest()